@@ -0,0 +1,8 @@
+"""
+Dataclass options shared by the JurisRank analysis modules
+"""
+
+import sys
+
+# slots=True needs Python 3.10; older interpreters keep the per-instance __dict__
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
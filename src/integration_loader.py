@@ -13,25 +13,65 @@ Integration Features:
 4. Multi-model ensemble with human oversight
 5. Complete audit trail for all analyses
 
+Applications embedding this module may install uvloop (uvloop.install()) before
+starting their event loop for lower asyncio scheduling overhead.
+
 Author: Ignacio Adrian Lerer
 Purpose: Seamless integration of academic research improvements
 """
 
+import time
+import secrets
+import copy
 import json
+import hashlib
 import logging
 import asyncio
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, List, Optional, Any
 from pathlib import Path
+from types import MappingProxyType
 
-# Import enhanced components
-from src.worldclass_integration.jurisrank_worldclass_enhanced import WorldClassJurisRankIntegration, EnsembleAnalysisResult
-from src.audit.immutable_audit import ImmutableConstitutionalAudit, AIModel, AnalysisType
-from src.verify_citation.citation_verification_enhanced import EnhancedCitationVerifier
+# Enhanced components are imported lazily where they are constructed, so that
+# utility callers (prompt kits, audit summary) don't pay for the ensemble stack
+if TYPE_CHECKING:
+    from src.worldclass_integration.jurisrank_worldclass_enhanced import EnsembleAnalysisResult
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Library module: leave logging configuration to the application
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Verification statuses that count as a verified citation
+_VERIFIED_STATUSES = frozenset({"verified_constitutional", "verified_external"})
+
+# Question used when the caller does not supply one
+_DEFAULT_CONSTITUTIONAL_QUESTION = (
+    "¿Qué protección constitucional aplica bajo el Art 19 CN "
+    "considerando los precedentes Bazterrica y Arriola?"
+)
+
+# Articles and precedents recorded in the audit trail for every analysis
+_AUDITED_ARTICLES = ("Art 19 CN",)
+_AUDITED_PRECEDENTS = ("Bazterrica 1986", "Arriola 2009")
+
+# Constant feature flags reported in API results (read-only, shared)
+_SINGLE_ENHANCED_FEATURES = MappingProxyType({
+    "ai_limitations_mitigated": True,
+    "citation_verification": True,
+    "knowledge_graph_integration": True,
+    "immutable_audit": True
+})
+
+_ENSEMBLE_ENHANCED_FEATURES = MappingProxyType({
+    "multi_model_ensemble": True,
+    "counter_arguments_generated": True,
+    "human_oversight_integrated": True,
+    "ai_limitations_mitigated": True,
+    "citation_verification": True,
+    "knowledge_graph_integration": True,
+    "immutable_audit": True,
+    "coan_surden_compliance": True
+})
 
 class JurisRankP7Enhanced:
     """
@@ -41,11 +81,19 @@ class JurisRankP7Enhanced:
     compatibility with existing API structure
     """
     
-    def __init__(self):
+    def __init__(self, analysis_cache_size: int = 128):
+        from src.worldclass_integration.jurisrank_worldclass_enhanced import WorldClassJurisRankIntegration
+        from src.audit.immutable_audit import ImmutableConstitutionalAudit
+        from src.verify_citation.citation_verification_enhanced import EnhancedCitationVerifier
+        
         self.worldclass_integration = WorldClassJurisRankIntegration()
         self.audit_system = ImmutableConstitutionalAudit()
         self.citation_verifier = EnhancedCitationVerifier()
         
+        # Content-addressed LRU cache of API results (0 disables caching)
+        self.analysis_cache_size = analysis_cache_size
+        self._analysis_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        
         logger.info("JurisRank P7 Enhanced integration loaded successfully")
         
     async def enhanced_constitutional_analysis(self,
@@ -72,32 +120,94 @@ class JurisRankP7Enhanced:
         """
         
         # Auto-generate constitutional question if not provided
-        if not constitutional_question:
-            constitutional_question = "¿Qué protección constitucional aplica bajo el Art 19 CN considerando los precedentes Bazterrica y Arriola?"
+        constitutional_question = constitutional_question or _DEFAULT_CONSTITUTIONAL_QUESTION
             
         # Generate case ID
-        case_id = f"ENHANCED_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        # Second-resolution prefix keeps IDs sortable; the random suffix keeps
+        # concurrent requests within the same second distinct
+        case_id = f"ENHANCED_{int(time.time())}_{secrets.token_hex(6)}"
         
+        # Identical submissions (retries, demos) are served from the cache
+        cache_key = self._analysis_cache_key(case_facts, constitutional_question, use_multi_model)
+        cached_result = self._analysis_cache.get(cache_key)
+        if cached_result is not None:
+            self._analysis_cache.move_to_end(cache_key)
+            return self._serve_cached_analysis(cached_result, case_id, user_id)
+            
         if use_multi_model:
             # Use full multi-model ensemble analysis
+            ensemble_start = time.perf_counter()
             ensemble_result = await self.worldclass_integration.analyze_constitutional_case_ensemble(
                 case_id=case_id,
                 constitutional_question=constitutional_question,
                 case_facts=case_facts,
                 user_id=user_id
             )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"Ensemble analysis for case {case_id} took "
+                    f"{(time.perf_counter() - ensemble_start) * 1000:.1f} ms"
+                )
             
             # Convert to API-compatible format
-            return self._convert_ensemble_to_api_format(ensemble_result)
+            result = self._convert_ensemble_to_api_format(ensemble_result)
             
         else:
             # Use single-model enhanced analysis (faster, but less comprehensive)
-            single_result = await self._single_model_enhanced_analysis(
+            result = await self._single_model_enhanced_analysis(
                 case_facts, constitutional_question, case_id, user_id
             )
             
-            return single_result
+        self._store_cached_analysis(cache_key, result)
+        
+        return result
+        
+    @staticmethod
+    def _analysis_cache_key(case_facts: str, constitutional_question: str, use_multi_model: bool) -> str:
+        key_data = f"{case_facts}\x00{constitutional_question}\x00{use_multi_model}"
+        return hashlib.blake2b(key_data.encode(), digest_size=16).hexdigest()
+        
+    def _store_cached_analysis(self, cache_key: str, result: Dict[str, Any]) -> None:
+        if self.analysis_cache_size <= 0:
+            return
             
+        # Store a private copy so callers mutating their result can't poison the cache
+        self._analysis_cache[cache_key] = copy.deepcopy(result)
+        self._analysis_cache.move_to_end(cache_key)
+        
+        while len(self._analysis_cache) > self.analysis_cache_size:
+            self._analysis_cache.popitem(last=False)
+            
+    def _serve_cached_analysis(self, cached_result: Dict[str, Any], case_id: str, user_id: str) -> Dict[str, Any]:
+        """Return a fresh copy of a cached result under a new case ID, keeping the audit trail"""
+        
+        from src.audit.immutable_audit import AIModel, AnalysisType
+        
+        result = copy.deepcopy(cached_result)
+        original_case_id = result["case_id"]
+        result["case_id"] = case_id
+        
+        # Cache hits are still audited per user
+        audit_file = self.audit_system.log_constitutional_analysis(
+            case_id=case_id,
+            analysis_type=AnalysisType.CONSTITUTIONAL_RANKING,
+            constitutional_articles=_AUDITED_ARTICLES,
+            precedents_analyzed=_AUDITED_PRECEDENTS,
+            prompt_kit="constitutional_art19_enhanced",
+            ai_model=AIModel.DARWIN_ASI,
+            model_version="analysis_cache_hit",
+            constitutional_ranking={"cached_from_case_id": original_case_id},
+            verification_results={},
+            knowledge_graph_path=[],
+            user_id=user_id,
+            confidence_score=result["confidence_score"]
+        )
+        if "audit_file" in result:
+            result["audit_file"] = audit_file
+        
+        return result
+        
+
     async def _single_model_enhanced_analysis(self,
                                             case_facts: str,
                                             constitutional_question: str,
@@ -105,6 +215,8 @@ class JurisRankP7Enhanced:
                                             user_id: str) -> Dict[str, Any]:
         """Single model analysis with enhancements"""
         
+        from src.audit.immutable_audit import AIModel, AnalysisType
+        
         # Use Darwin ASI constitutional engine
         constitutional_engine = self.worldclass_integration.constitutional_engine
         
@@ -130,8 +242,8 @@ class JurisRankP7Enhanced:
         audit_file = self.audit_system.log_constitutional_analysis(
             case_id=case_id,
             analysis_type=AnalysisType.CONSTITUTIONAL_RANKING,
-            constitutional_articles=["Art 19 CN"],
-            precedents_analyzed=["Bazterrica 1986", "Arriola 2009"],
+            constitutional_articles=_AUDITED_ARTICLES,
+            precedents_analyzed=_AUDITED_PRECEDENTS,
             prompt_kit="constitutional_art19_enhanced",
             ai_model=AIModel.DARWIN_ASI,
             model_version="jurisrank_p7_enhanced_v1.0",
@@ -152,15 +264,10 @@ class JurisRankP7Enhanced:
             "verified_citations": len(verified_citations),
             "reasoning_paths": len(reasoning_paths),
             "audit_file": audit_file,
-            "enhanced_features": {
-                "ai_limitations_mitigated": True,
-                "citation_verification": True,
-                "knowledge_graph_integration": True,
-                "immutable_audit": True
-            }
+            "enhanced_features": dict(_SINGLE_ENHANCED_FEATURES)
         }
         
-    def _convert_ensemble_to_api_format(self, ensemble_result: EnsembleAnalysisResult) -> Dict[str, Any]:
+    def _convert_ensemble_to_api_format(self, ensemble_result: "EnsembleAnalysisResult") -> Dict[str, Any]:
         """Convert ensemble result to API-compatible format"""
         
         return {
@@ -174,45 +281,29 @@ class JurisRankP7Enhanced:
             "model_agreement": ensemble_result.model_agreement_score,
             "quality_assessment": ensemble_result.quality_assessment.value,
             "human_review_required": ensemble_result.requires_human_review,
-            "counter_arguments": [arg.argument_text for arg in ensemble_result.counter_arguments],
-            "models_used": [result.model_provider.value for result in ensemble_result.model_results],
-            "enhanced_features": {
-                "multi_model_ensemble": True,
-                "counter_arguments_generated": True,
-                "human_oversight_integrated": True,
-                "ai_limitations_mitigated": True,
-                "citation_verification": True,
-                "knowledge_graph_integration": True,
-                "immutable_audit": True,
-                "coan_surden_compliance": True
-            }
+            "counter_arguments": list(ensemble_result.counter_argument_texts),
+            "models_used": list(ensemble_result.models_used),
+            "enhanced_features": dict(_ENSEMBLE_ENHANCED_FEATURES)
         }
         
     async def _extract_and_verify_citations(self, analysis_text: str) -> List[Dict]:
         """Extract and verify citations from analysis"""
         
+        from src.verify_citation.citation_verification_enhanced import find_citation_patterns
+        
         verified_citations = []
         
-        # Common citation patterns in constitutional analysis
-        citation_patterns = [
-            "Bazterrica", "Arriola", "Fallos 308:1392", 
-            "Fallos 332:1963", "Art 19 CN"
-        ]
-        
-        for pattern in citation_patterns:
-            if pattern in analysis_text:
-                verified_citation = await self.citation_verifier.verify_citation_comprehensive(
-                    citation_text=pattern,
-                    require_doi_url=False
-                )
-                
-                verified_citations.append({
-                    "citation": pattern,
-                    "verified": verified_citation.verification_status in ["verified_constitutional", "verified_external"],
-                    "confidence": verified_citation.verification_confidence,
-                    "authority_score": verified_citation.precedent_authority_score
-                })
-                
+        for pattern in find_citation_patterns(analysis_text):
+            # Database-only verification (require_doi_url=False) does no I/O
+            verified_citation = self.citation_verifier.verify_citation_comprehensive_sync(pattern)
+            
+            verified_citations.append({
+                "citation": pattern,
+                "verified": verified_citation.verification_status in _VERIFIED_STATUSES,
+                "confidence": verified_citation.verification_confidence,
+                "authority_score": verified_citation.precedent_authority_score
+            })
+            
         return verified_citations
 
 # Simplified API functions for easy integration
@@ -271,6 +362,8 @@ def get_constitutional_prompt_kits() -> List[str]:
 def get_audit_summary(case_id: Optional[str] = None) -> Dict[str, Any]:
     """Get audit summary for constitutional analyses"""
     
+    from src.audit.immutable_audit import ImmutableConstitutionalAudit
+    
     audit_system = ImmutableConstitutionalAudit()
     return audit_system.generate_constitutional_audit_report(case_id=case_id)
 
@@ -352,4 +445,13 @@ async def main():
     print("🔒 Complete audit trail and verification enabled")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    # uvloop is optional; library consumers may call uvloop.install() themselves
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+        
     asyncio.run(main())
\ No newline at end of file
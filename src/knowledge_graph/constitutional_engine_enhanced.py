@@ -14,17 +14,83 @@ Integration Target: JurisRank P7 Production System
 Research Base: AI Limitations in Legal Practice (Academic Sources)
 """
 
+import os
+import sys
 import json
+import hashlib
 import logging
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
-from datetime import datetime
-import networkx as nx
+import threading
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union, get_args, get_origin, get_type_hints
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from operator import attrgetter
+from datetime import date
 from enum import Enum
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Library module: leave logging configuration to the application
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Shared with the other analysis modules (src/dataclass_compat.py)
+try:
+    from dataclass_compat import DATACLASS_SLOTS as _DATACLASS_SLOTS
+except ImportError:
+    # Imported as src.<package>.<module>: put src/ on the path
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from dataclass_compat import DATACLASS_SLOTS as _DATACLASS_SLOTS
+
+def _to_dict_expr(annotation: Any, expr: str) -> str:
+    """Source expression converting `expr` (typed `annotation`) to JSON-ready data"""
+    
+    origin = get_origin(annotation)
+    
+    if origin is Union:
+        # Optional[X]: convert X unless the value is None
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        inner = _to_dict_expr(args[0], expr) if len(args) == 1 else expr
+        return expr if inner == expr else f"(None if {expr} is None else {inner})"
+        
+    if origin in (list, tuple):
+        args = get_args(annotation)
+        item = _to_dict_expr(args[0], "item") if args else "item"
+        return f"list({expr})" if item == "item" else f"[{item} for item in {expr}]"
+        
+    if isinstance(annotation, type):
+        if issubclass(annotation, Enum):
+            return f"{expr}.value"
+        if issubclass(annotation, date):
+            return f"{expr}.isoformat()"
+        if hasattr(annotation, "to_dict"):
+            return f"{expr}.to_dict()"
+            
+    return expr
+
+def fast_serializable(cls):
+    """
+    Class decorator generating a to_dict() method for a dataclass
+    
+    The method body is generated once from the field annotations and compiled
+    with exec, so serialization is a single dict literal rather than the
+    recursive field reflection dataclasses.asdict performs on every call.
+    Enums become their value, dates ISO strings and nested
+    fast_serializable dataclasses their own to_dict().
+    """
+    
+    hints = get_type_hints(cls)
+    items = "".join(
+        f"        {field.name!r}: {_to_dict_expr(hints[field.name], 'self.' + field.name)},\n"
+        for field in fields(cls)
+    )
+    source = f"def to_dict(self):\n    return {{\n{items}    }}\n"
+    
+    namespace = {}
+    exec(source, {}, namespace)
+    to_dict = namespace["to_dict"]
+    to_dict.__qualname__ = f"{cls.__qualname__}.to_dict"
+    to_dict.__doc__ = f"Convert this {cls.__name__} to a JSON-ready dict"
+    cls.to_dict = to_dict
+    return cls
 
 class ConstitutionalPrinciple(Enum):
     """Constitutional principles from Art 19 CN analysis"""
@@ -34,6 +100,12 @@ class ConstitutionalPrinciple(Enum):
     HARM_TO_OTHERS = "harm_to_others_test"
     CONSTITUTIONAL_MORALITY = "constitutional_morality"
 
+# Display titles for report headings, e.g. "Harm To Others Test"
+_PRINCIPLE_TITLE = {
+    principle: principle.value.replace('_', ' ').title()
+    for principle in ConstitutionalPrinciple
+}
+
 class PrecedentAuthority(Enum):
     """Precedential authority levels using JurisRank P7 scoring"""
     CONSTITUTIONAL_DOCTRINE = 100  # CSJN constitutional doctrine
@@ -43,300 +115,47 @@ class PrecedentAuthority(Enum):
     APPELLATE_DIVIDED = 40        # Conflicting appellate precedents
     TRIAL_LEVEL = 20              # Trial court decisions
 
-@dataclass
+@fast_serializable
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class ConstitutionalCase:
-    """Represents a constitutional case with full metadata"""
+    """Represents a constitutional case with full metadata (immutable, hashable)"""
     name: str
     citation: str
-    date: datetime
+    date: date
     court: str
-    constitutional_articles: List[str]
-    principles_applied: List[ConstitutionalPrinciple]
+    constitutional_articles: Tuple[str, ...]
+    principles_applied: Tuple[ConstitutionalPrinciple, ...]
     precedent_authority: PrecedentAuthority
     case_summary: str
     constitutional_holding: str
     overruled_by: Optional[str] = None
     evolutionary_significance: Optional[str] = None
 
-@dataclass 
+@fast_serializable
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class ConstitutionalAnalysisPath:
-    """Represents a reasoning path through constitutional precedents"""
+    """Represents a reasoning path through constitutional precedents (immutable, hashable)"""
     starting_principle: ConstitutionalPrinciple
-    precedent_chain: List[ConstitutionalCase]
+    precedent_chain: Tuple[ConstitutionalCase, ...]
     constitutional_conclusion: str
     confidence_score: float
     citation_verification_status: bool
-    alternative_interpretations: List[str]
+    alternative_interpretations: Tuple[str, ...]
 
-class ConstitutionalKnowledgeGraph:
-    """
-    Enhanced Constitutional Analysis Engine addressing AI limitations
-    
-    Key Features:
-    - Knowledge graph structure addresses context window limitations
-    - Verified precedent network eliminates hallucination risks
-    - Multi-path reasoning reduces prompt sensitivity  
-    - Complete citation traceability ensures transparency
-    """
-    
-    def __init__(self):
-        self.graph = nx.DiGraph()
-        self.constitutional_cases = {}
-        self.precedent_evolution_chains = {}
-        self.citation_verification_db = {}
-        
-        # Load existing constitutional analysis from current system
-        self._initialize_constitutional_knowledge_base()
-        
-    def _initialize_constitutional_knowledge_base(self):
-        """
-        Initialize knowledge graph with existing JurisRank constitutional analysis
-        Based on current system's Art 19 CN, Bazterrica, and Arriola analysis
-        """
-        
-        # Constitutional Article 19 CN - Base Node
-        self.graph.add_node("ART_19_CN", 
-                          type="constitutional_article",
-                          text="Las acciones privadas de los hombres que de ningún modo ofendan al orden y a la moral pública, ni perjudiquen a un tercero, están sólo reservadas a Dios, y exentas de la autoridad de los magistrados.",
-                          principles=[
-                              ConstitutionalPrinciple.PERSONAL_AUTONOMY,
-                              ConstitutionalPrinciple.HARM_TO_OTHERS,
-                              ConstitutionalPrinciple.PRIVACY_RIGHTS
-                          ])
-        
-        # Bazterrica Case - Historical Precedent  
-        bazterrica = ConstitutionalCase(
-            name="Bazterrica, Gustavo Mario",
-            citation="CSJN Fallos 308:1392 (1986)",
-            date=datetime(1986, 8, 29),
-            court="Corte Suprema de Justicia de la Nación",
-            constitutional_articles=["Art 19 CN"],
-            principles_applied=[
-                ConstitutionalPrinciple.PERSONAL_AUTONOMY,
-                ConstitutionalPrinciple.HARM_TO_OTHERS
-            ],
-            precedent_authority=PrecedentAuthority.CONSTITUTIONAL_DOCTRINE,
-            case_summary="Tenencia de estupefacientes para consumo personal no constituye delito bajo Art 19 CN",
-            constitutional_holding="Las acciones privadas que no dañen a terceros están fuera del ámbito de regulación estatal conforme Art 19 CN. La tenencia para consumo personal no genera daño a terceros directo y mensurable.",
-            overruled_by="Arriola 2009",
-            evolutionary_significance="Estableció doctrina constitucional sobre autonomía personal y test de daño a terceros"
-        )
-        
-        self.constitutional_cases["BAZTERRICA_1986"] = bazterrica
-        self.graph.add_node("BAZTERRICA_1986", case=bazterrica, type="constitutional_precedent")
-        
-        # Arriola Case - Modern Precedent
-        arriola = ConstitutionalCase(
-            name="Arriola, Sebastián y otros",
-            citation="CSJN Fallos 332:1963 (2009)", 
-            date=datetime(2009, 8, 25),
-            court="Corte Suprema de Justicia de la Nación",
-            constitutional_articles=["Art 19 CN", "Art 75 inc 22 CN"],
-            principles_applied=[
-                ConstitutionalPrinciple.PERSONAL_AUTONOMY,
-                ConstitutionalPrinciple.CONSTITUTIONAL_MORALITY,
-                ConstitutionalPrinciple.HARM_TO_OTHERS
-            ],
-            precedent_authority=PrecedentAuthority.CONSTITUTIONAL_DOCTRINE,
-            case_summary="Reafirma principios de Bazterrica con enfoque en derechos humanos y dignidad personal",
-            constitutional_holding="El Art 19 CN protege la autonomía personal en decisiones que solo afectan al individuo. El Estado no puede imponer una moral particular en aspectos privados. Se requiere daño efectivo y no meramente moral para justificar intervención estatal.",
-            evolutionary_significance="Evolución hacia enfoque de derechos humanos y dignidad personal, incorporando estándares internacionales"
-        )
-        
-        self.constitutional_cases["ARRIOLA_2009"] = arriola
-        self.graph.add_node("ARRIOLA_2009", case=arriola, type="constitutional_precedent")
-        
-        # Constitutional Relationships
-        self.graph.add_edge("ART_19_CN", "BAZTERRICA_1986", relationship="interprets")
-        self.graph.add_edge("ART_19_CN", "ARRIOLA_2009", relationship="interprets") 
-        self.graph.add_edge("ARRIOLA_2009", "BAZTERRICA_1986", relationship="reaffirms_and_evolves")
-        
-        # Precedent Evolution Chain
-        self.precedent_evolution_chains["PERSONAL_AUTONOMY_ART19"] = [
-            "BAZTERRICA_1986",
-            "ARRIOLA_2009"
-        ]
-        
-        logger.info("Constitutional knowledge graph initialized with verified precedents")
-        
-    def find_constitutional_reasoning_paths(self, 
-                                          constitutional_issue: str,
-                                          case_facts: str) -> List[ConstitutionalAnalysisPath]:
-        """
-        Find multiple reasoning paths through constitutional precedents
-        Addresses prompt sensitivity by providing alternative constitutional interpretations
-        """
-        
-        reasoning_paths = []
-        
-        # Path 1: Personal Autonomy Analysis (Bazterrica → Arriola evolution)
-        autonomy_path = self._analyze_personal_autonomy_path(case_facts)
-        reasoning_paths.append(autonomy_path)
-        
-        # Path 2: Harm to Others Test Analysis
-        harm_test_path = self._analyze_harm_to_others_path(case_facts)
-        reasoning_paths.append(harm_test_path)
-        
-        # Path 3: Constitutional Morality Analysis (Post-Arriola approach)
-        morality_path = self._analyze_constitutional_morality_path(case_facts)
-        reasoning_paths.append(morality_path)
-        
-        # Sort by confidence score  
-        reasoning_paths.sort(key=lambda path: path.confidence_score, reverse=True)
-        
-        return reasoning_paths
-        
-    def _analyze_personal_autonomy_path(self, case_facts: str) -> ConstitutionalAnalysisPath:
-        """
-        Analyze case through personal autonomy lens using Bazterrica-Arriola evolution
-        """
-        
-        precedent_chain = [
-            self.constitutional_cases["BAZTERRICA_1986"],
-            self.constitutional_cases["ARRIOLA_2009"]
-        ]
-        
-        constitutional_conclusion = f"""
-        ANÁLISIS DE AUTONOMÍA PERSONAL (Art 19 CN)
-        
-        Conforme la evolución jurisprudencial Bazterrica (1986) → Arriola (2009), el Art 19 CN 
-        protege las decisiones personales que:
-        
-        1. ESFERA PRIVADA: Se desarrollan en el ámbito privado del individuo
-        2. AUSENCIA DE DAÑO: No generan perjuicio efectivo a terceros
-        3. AUTONOMÍA MORAL: Respetan la capacidad de autodeterminación personal
-        
-        APLICACIÓN AL CASO:
-        {self._apply_autonomy_test_to_facts(case_facts)}
-        
-        PRECEDENTE EVOLUTIVO:
-        - Bazterrica (1986): Estableció test de daño a terceros como límite constitucional
-        - Arriola (2009): Incorporó dignidad humana y estándares internacionales de DDHH
-        
-        CONCLUSIÓN CONSTITUCIONAL:
-        {self._generate_autonomy_conclusion(case_facts)}
-        """
-        
-        return ConstitutionalAnalysisPath(
-            starting_principle=ConstitutionalPrinciple.PERSONAL_AUTONOMY,
-            precedent_chain=precedent_chain,
-            constitutional_conclusion=constitutional_conclusion,
-            confidence_score=0.92,
-            citation_verification_status=True,
-            alternative_interpretations=[
-                "Interpretación restrictiva: énfasis en orden público",
-                "Interpretación expansiva: máxima protección de autonomía"
-            ]
-        )
-        
-    def _analyze_harm_to_others_path(self, case_facts: str) -> ConstitutionalAnalysisPath:
-        """
-        Analyze case through harm to others constitutional test
-        """
-        
-        precedent_chain = [
-            self.constitutional_cases["BAZTERRICA_1986"],
-            self.constitutional_cases["ARRIOLA_2009"]
-        ]
-        
-        constitutional_conclusion = f"""
-        TEST CONSTITUCIONAL DE DAÑO A TERCEROS (Art 19 CN)
-        
-        El límite constitucional del Art 19 CN requiere analizar si la conducta:
-        
-        1. DAÑO EFECTIVO: Genera perjuicio real y mensurable a terceros identificables
-        2. CAUSALIDAD DIRECTA: Existe relación causal entre la conducta y el daño
-        3. PROPORCIONALIDAD: La intervención estatal es proporcional al daño prevenido
-        
-        ESTÁNDAR JURISPRUDENCIAL:
-        - Bazterrica: "perjudiquen a un tercero" requiere daño efectivo, no meramente potencial
-        - Arriola: Reafirma que el daño debe ser "efectivo" y no basado en consideraciones morales abstractas
-        
-        ANÁLISIS DEL CASO:
-        {self._apply_harm_test_to_facts(case_facts)}
-        
-        CONCLUSIÓN SOBRE DAÑO A TERCEROS:
-        {self._generate_harm_test_conclusion(case_facts)}
-        """
-        
-        return ConstitutionalAnalysisPath(
-            starting_principle=ConstitutionalPrinciple.HARM_TO_OTHERS,
-            precedent_chain=precedent_chain,
-            constitutional_conclusion=constitutional_conclusion,
-            confidence_score=0.89,
-            citation_verification_status=True,
-            alternative_interpretations=[
-                "Test estricto: solo daño inmediato y directo",
-                "Test moderado: incluye riesgos significativos a terceros"
-            ]
-        )
-        
-    def _analyze_constitutional_morality_path(self, case_facts: str) -> ConstitutionalAnalysisPath:
-        """
-        Analyze constitutional morality limits per Arriola evolution
-        """
-        
-        precedent_chain = [self.constitutional_cases["ARRIOLA_2009"]]
-        
-        constitutional_conclusion = f"""
-        MORALIDAD CONSTITUCIONAL Y LÍMITES ESTATALES (Art 19 CN post-Arriola)
-        
-        La evolución constitucional post-Arriola establece que:
-        
-        1. NEUTRALIDAD MORAL: El Estado no puede imponer una concepción particular de moral
-        2. DIGNIDAD HUMANA: Respeto por la dignidad y autonomía inherente de la persona
-        3. ESTÁNDARES INTERNACIONALES: Integración de tratados de DDHH (Art 75 inc 22 CN)
-        
-        DOCTRINA ARRIOLA (2009):
-        "El Estado no puede aplicar el derecho penal para imponer un determinado modelo de virtud"
-        
-        APLICACIÓN:
-        {self._apply_morality_test_to_facts(case_facts)}
-        
-        CONCLUSIÓN SOBRE MORALIDAD CONSTITUCIONAL:
-        {self._generate_morality_conclusion(case_facts)}
-        """
-        
-        return ConstitutionalAnalysisPath(
-            starting_principle=ConstitutionalPrinciple.CONSTITUTIONAL_MORALITY,
-            precedent_chain=precedent_chain,
-            constitutional_conclusion=constitutional_conclusion,
-            confidence_score=0.85,
-            citation_verification_status=True,
-            alternative_interpretations=[
-                "Enfoque laico: completa neutralidad moral estatal",
-                "Enfoque moderado: moral mínima compatible con pluralismo"
-            ]
-        )
-        
-    def generate_comprehensive_constitutional_analysis(self, 
-                                                    case_facts: str,
-                                                    legal_question: str) -> str:
-        """
-        Generate comprehensive constitutional analysis addressing AI limitations
-        
-        Features:
-        1. Multiple reasoning paths (reduces prompt sensitivity)
-        2. Verified citations (eliminates hallucinations)  
-        3. Structured analysis (addresses context window issues)
-        4. Complete traceability (ensures transparency)
-        """
-        
-        # Get multiple constitutional reasoning paths
-        reasoning_paths = self.find_constitutional_reasoning_paths(
-            constitutional_issue=legal_question,
-            case_facts=case_facts
-        )
-        
-        # Build comprehensive analysis integrating all paths
-        analysis = f"""
+# Static Markdown of the comprehensive analysis report, split around the
+# per-query slots so each report is assembled with a single join
+_REPORT_HEADER = """
 # ANÁLISIS CONSTITUCIONAL INTEGRAL - ART 19 CONSTITUCIÓN NACIONAL
 ## Sistema JurisRank P7 Enhanced - Mitigación de Limitaciones de IA
 
-**Cuestión Constitucional:** {legal_question}
+**Cuestión Constitucional:** """
+
+_REPORT_FACTS_HEADING = """
 
 **Hechos del Caso:**
-{case_facts}
+"""
+
+_REPORT_SECTIONS_I_TO_III = """
 
 ---
 
@@ -383,7 +202,9 @@ class ConstitutionalKnowledgeGraph:
 
 ## III. ANÁLISIS CONSTITUCIONAL MULTI-PATH (Mitigación de Sensibilidad de Prompt)
 
-{self._format_multiple_reasoning_paths(reasoning_paths)}
+"""
+
+_REPORT_SECTIONS_IV_TO_V = """
 
 ---
 
@@ -413,13 +234,17 @@ class ConstitutionalKnowledgeGraph:
 
 ## V. APLICACIÓN AL CASO CONCRETO
 
-{self._apply_integrated_constitutional_test(case_facts, legal_question)}
+"""
+
+_REPORT_SECTION_VI = """
 
 ---
 
 ## VI. CONCLUSIÓN CONSTITUCIONAL
 
-{self._generate_integrated_constitutional_conclusion(reasoning_paths, case_facts)}
+"""
+
+_REPORT_SECTION_VII = """
 
 ---
 
@@ -444,52 +269,352 @@ class ConstitutionalKnowledgeGraph:
 *Basado en investigación académica sobre limitaciones de IA en práctica legal*
 *Sistema de análisis constitucional con verificación y trazabilidad completa*
 """
-        
-        return analysis
-        
-    def _format_multiple_reasoning_paths(self, paths: List[ConstitutionalAnalysisPath]) -> str:
-        """Format multiple reasoning paths for comprehensive analysis"""
-        
-        formatted_paths = ""
-        
-        for i, path in enumerate(paths, 1):
-            formatted_paths += f"""
-### Path {i}: {path.starting_principle.value.replace('_', ' ').title()}
-**Confianza:** {path.confidence_score:.0%} | **Verificación:** {'✅' if path.citation_verification_status else '❌'}
 
-{path.constitutional_conclusion}
+# Default number of comprehensive reports kept per engine instance
+_REPORT_CACHE_MAX = 256
+
+# One reasoning path in section III of the report
+_PATH_BLOCK_TEMPLATE = """
+### Path {idx}: {title}
+**Confianza:** {confidence:.0%} | **Verificación:** {check}
+
+{conclusion}
 
 **Interpretaciones Alternativas:**
-{chr(10).join(f"- {alt}" for alt in path.alternative_interpretations)}
+{alts}
 
 ---
 """
+
+# Characters of the case facts quoted in each reasoning path conclusion
+_FACTS_EXCERPT_LENGTH = 200
+
+# A reasoning path is data: the query only contributes the facts excerpt,
+# spliced between conclusion_prefix and conclusion_suffix
+class _PathSpec(NamedTuple):
+    """Static description of one constitutional reasoning path"""
+    principle: ConstitutionalPrinciple
+    precedent_keys: Tuple[str, ...]
+    conclusion_prefix: str
+    conclusion_suffix: str
+    confidence: float
+    alternatives: Tuple[str, ...]
+
+_PATH_SPECS = (
+    # Path 1: Personal Autonomy Analysis (Bazterrica → Arriola evolution)
+    _PathSpec(
+        principle=ConstitutionalPrinciple.PERSONAL_AUTONOMY,
+        precedent_keys=("BAZTERRICA_1986", "ARRIOLA_2009"),
+        conclusion_prefix="""
+        ANÁLISIS DE AUTONOMÍA PERSONAL (Art 19 CN)
+        
+        Conforme la evolución jurisprudencial Bazterrica (1986) → Arriola (2009), el Art 19 CN 
+        protege las decisiones personales que:
+        
+        1. ESFERA PRIVADA: Se desarrollan en el ámbito privado del individuo
+        2. AUSENCIA DE DAÑO: No generan perjuicio efectivo a terceros
+        3. AUTONOMÍA MORAL: Respetan la capacidad de autodeterminación personal
+        
+        APLICACIÓN AL CASO:
+        Análisis de autonomía personal aplicado a: """,
+        conclusion_suffix="""...
+        
+        PRECEDENTE EVOLUTIVO:
+        - Bazterrica (1986): Estableció test de daño a terceros como límite constitucional
+        - Arriola (2009): Incorporó dignidad humana y estándares internacionales de DDHH
+        
+        CONCLUSIÓN CONSTITUCIONAL:
+        Conclusión basada en autonomía personal y precedentes verificados.
+        """,
+        confidence=0.92,
+        alternatives=(
+            "Interpretación restrictiva: énfasis en orden público",
+            "Interpretación expansiva: máxima protección de autonomía"
+        )
+    ),
+    # Path 2: Harm to Others Test Analysis
+    _PathSpec(
+        principle=ConstitutionalPrinciple.HARM_TO_OTHERS,
+        precedent_keys=("BAZTERRICA_1986", "ARRIOLA_2009"),
+        conclusion_prefix="""
+        TEST CONSTITUCIONAL DE DAÑO A TERCEROS (Art 19 CN)
+        
+        El límite constitucional del Art 19 CN requiere analizar si la conducta:
+        
+        1. DAÑO EFECTIVO: Genera perjuicio real y mensurable a terceros identificables
+        2. CAUSALIDAD DIRECTA: Existe relación causal entre la conducta y el daño
+        3. PROPORCIONALIDAD: La intervención estatal es proporcional al daño prevenido
+        
+        ESTÁNDAR JURISPRUDENCIAL:
+        - Bazterrica: "perjudiquen a un tercero" requiere daño efectivo, no meramente potencial
+        - Arriola: Reafirma que el daño debe ser "efectivo" y no basado en consideraciones morales abstractas
+        
+        ANÁLISIS DEL CASO:
+        Test de daño a terceros aplicado a: """,
+        conclusion_suffix="""...
+        
+        CONCLUSIÓN SOBRE DAÑO A TERCEROS:
+        Conclusión basada en test de daño a terceros constitucional.
+        """,
+        confidence=0.89,
+        alternatives=(
+            "Test estricto: solo daño inmediato y directo",
+            "Test moderado: incluye riesgos significativos a terceros"
+        )
+    ),
+    # Path 3: Constitutional Morality Analysis (Post-Arriola approach)
+    _PathSpec(
+        principle=ConstitutionalPrinciple.CONSTITUTIONAL_MORALITY,
+        precedent_keys=("ARRIOLA_2009",),
+        conclusion_prefix="""
+        MORALIDAD CONSTITUCIONAL Y LÍMITES ESTATALES (Art 19 CN post-Arriola)
+        
+        La evolución constitucional post-Arriola establece que:
+        
+        1. NEUTRALIDAD MORAL: El Estado no puede imponer una concepción particular de moral
+        2. DIGNIDAD HUMANA: Respeto por la dignidad y autonomía inherente de la persona
+        3. ESTÁNDARES INTERNACIONALES: Integración de tratados de DDHH (Art 75 inc 22 CN)
+        
+        DOCTRINA ARRIOLA (2009):
+        "El Estado no puede aplicar el derecho penal para imponer un determinado modelo de virtud"
+        
+        APLICACIÓN:
+        Análisis de moralidad constitucional aplicado a: """,
+        conclusion_suffix="""...
+        
+        CONCLUSIÓN SOBRE MORALIDAD CONSTITUCIONAL:
+        Conclusión basada en moralidad constitucional y neutralidad estatal.
+        """,
+        confidence=0.85,
+        alternatives=(
+            "Enfoque laico: completa neutralidad moral estatal",
+            "Enfoque moderado: moral mínima compatible con pluralismo"
+        )
+    )
+)
+
+class ConstitutionalKnowledgeGraph:
+    """
+    Enhanced Constitutional Analysis Engine addressing AI limitations
+    
+    Key Features:
+    - Knowledge graph structure addresses context window limitations
+    - Verified precedent network eliminates hallucination risks
+    - Multi-path reasoning reduces prompt sensitivity  
+    - Complete citation traceability ensures transparency
+    """
+    
+    def __init__(self, report_cache_size: int = _REPORT_CACHE_MAX):
+        # The precedent graph is tiny, so plain dicts stand in for a graph library:
+        # node key -> attributes, and node key -> [(target key, relationship)]
+        self._nodes: Dict[str, Dict] = {}
+        self._adj: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
+        self.constitutional_cases = {}
+        self.precedent_evolution_chains = {}
+        self.citation_verification_db = {}
+        
+        # Repeated (issue, facts) queries (retries, batch evaluations) reuse the
+        # same immutable tuple of paths; the cache is per instance
+        self._reasoning_paths_cache = lru_cache(maxsize=512)(self._compute_reasoning_paths)
+        
+        # Finished reports keyed by a digest of (facts, question), least recently
+        # used first; per instance, so separate engines never share entries
+        self.report_cache_size = report_cache_size
+        self._report_cache: "OrderedDict[bytes, str]" = OrderedDict()
+        self._report_cache_lock = threading.Lock()
+        
+        # Load existing constitutional analysis from current system
+        self._initialize_constitutional_knowledge_base()
+        
+        # Cases are immutable, so paths citing the same precedents share one tuple
+        self._precedent_chains = {
+            spec.precedent_keys: tuple(self.constitutional_cases[key] for key in spec.precedent_keys)
+            for spec in _PATH_SPECS
+        }
+
+        
+    def _initialize_constitutional_knowledge_base(self):
+        """
+        Initialize knowledge graph with existing JurisRank constitutional analysis
+        Based on current system's Art 19 CN, Bazterrica, and Arriola analysis
+        """
+        
+        # Constitutional Article 19 CN - Base Node
+        self._nodes["ART_19_CN"] = dict(
+            type="constitutional_article",
+            text="Las acciones privadas de los hombres que de ningún modo ofendan al orden y a la moral pública, ni perjudiquen a un tercero, están sólo reservadas a Dios, y exentas de la autoridad de los magistrados.",
+            principles=[
+                ConstitutionalPrinciple.PERSONAL_AUTONOMY,
+                ConstitutionalPrinciple.HARM_TO_OTHERS,
+                ConstitutionalPrinciple.PRIVACY_RIGHTS
+            ]
+        )
+        
+        # Bazterrica Case - Historical Precedent  
+        bazterrica = ConstitutionalCase(
+            name="Bazterrica, Gustavo Mario",
+            citation="CSJN Fallos 308:1392 (1986)",
+            date=date(1986, 8, 29),
+            court="Corte Suprema de Justicia de la Nación",
+            constitutional_articles=("Art 19 CN",),
+            principles_applied=(
+                ConstitutionalPrinciple.PERSONAL_AUTONOMY,
+                ConstitutionalPrinciple.HARM_TO_OTHERS
+            ),
+            precedent_authority=PrecedentAuthority.CONSTITUTIONAL_DOCTRINE,
+            case_summary="Tenencia de estupefacientes para consumo personal no constituye delito bajo Art 19 CN",
+            constitutional_holding="Las acciones privadas que no dañen a terceros están fuera del ámbito de regulación estatal conforme Art 19 CN. La tenencia para consumo personal no genera daño a terceros directo y mensurable.",
+            overruled_by="Arriola 2009",
+            evolutionary_significance="Estableció doctrina constitucional sobre autonomía personal y test de daño a terceros"
+        )
+        
+        self.constitutional_cases["BAZTERRICA_1986"] = bazterrica
+        self._nodes["BAZTERRICA_1986"] = dict(case=bazterrica, type="constitutional_precedent")
+        
+        # Arriola Case - Modern Precedent
+        arriola = ConstitutionalCase(
+            name="Arriola, Sebastián y otros",
+            citation="CSJN Fallos 332:1963 (2009)", 
+            date=date(2009, 8, 25),
+            court="Corte Suprema de Justicia de la Nación",
+            constitutional_articles=("Art 19 CN", "Art 75 inc 22 CN"),
+            principles_applied=(
+                ConstitutionalPrinciple.PERSONAL_AUTONOMY,
+                ConstitutionalPrinciple.CONSTITUTIONAL_MORALITY,
+                ConstitutionalPrinciple.HARM_TO_OTHERS
+            ),
+            precedent_authority=PrecedentAuthority.CONSTITUTIONAL_DOCTRINE,
+            case_summary="Reafirma principios de Bazterrica con enfoque en derechos humanos y dignidad personal",
+            constitutional_holding="El Art 19 CN protege la autonomía personal en decisiones que solo afectan al individuo. El Estado no puede imponer una moral particular en aspectos privados. Se requiere daño efectivo y no meramente moral para justificar intervención estatal.",
+            evolutionary_significance="Evolución hacia enfoque de derechos humanos y dignidad personal, incorporando estándares internacionales"
+        )
+        
+        self.constitutional_cases["ARRIOLA_2009"] = arriola
+        self._nodes["ARRIOLA_2009"] = dict(case=arriola, type="constitutional_precedent")
+        
+        # Constitutional Relationships
+        self._adj["ART_19_CN"].append(("BAZTERRICA_1986", "interprets"))
+        self._adj["ART_19_CN"].append(("ARRIOLA_2009", "interprets"))
+        self._adj["ARRIOLA_2009"].append(("BAZTERRICA_1986", "reaffirms_and_evolves"))
+        
+        # Precedent Evolution Chain
+        self.precedent_evolution_chains["PERSONAL_AUTONOMY_ART19"] = [
+            "BAZTERRICA_1986",
+            "ARRIOLA_2009"
+        ]
+        
+        logger.info("Constitutional knowledge graph initialized with verified precedents")
+        
+    def find_constitutional_reasoning_paths(self, 
+                                          constitutional_issue: str,
+                                          case_facts: str) -> Tuple[ConstitutionalAnalysisPath, ...]:
+        """
+        Find multiple reasoning paths through constitutional precedents
+        Addresses prompt sensitivity by providing alternative constitutional interpretations
+        
+        Results are memoized per (constitutional_issue, case_facts) and returned
+        as a tuple, so callers must not mutate the returned paths
+        """
+        
+        return self._reasoning_paths_cache(constitutional_issue, case_facts)
         
-        return formatted_paths
+    def _compute_reasoning_paths(self,
+                                 constitutional_issue: str,
+                                 case_facts: str) -> Tuple[ConstitutionalAnalysisPath, ...]:
+        """Build and rank the reasoning paths for find_constitutional_reasoning_paths"""
         
-    def _apply_autonomy_test_to_facts(self, case_facts: str) -> str:
-        """Apply personal autonomy test to specific case facts"""
-        return f"Análisis de autonomía personal aplicado a: {case_facts[:200]}..."
+        # Sliced once and shared by every path, so excerpts can't drift apart
+        facts_excerpt = case_facts[:_FACTS_EXCERPT_LENGTH]
+        reasoning_paths = [self._build_path(spec, facts_excerpt) for spec in _PATH_SPECS]
         
-    def _apply_harm_test_to_facts(self, case_facts: str) -> str:
-        """Apply harm to others test to specific case facts"""
-        return f"Test de daño a terceros aplicado a: {case_facts[:200]}..."
+        # Sort by confidence score  
+        reasoning_paths.sort(key=attrgetter("confidence_score"), reverse=True)
         
-    def _apply_morality_test_to_facts(self, case_facts: str) -> str:
-        """Apply constitutional morality test to specific case facts"""
-        return f"Análisis de moralidad constitucional aplicado a: {case_facts[:200]}..."
+        return tuple(reasoning_paths)
         
-    def _generate_autonomy_conclusion(self, case_facts: str) -> str:
-        """Generate autonomy-based constitutional conclusion"""
-        return "Conclusión basada en autonomía personal y precedentes verificados."
+    def _build_path(self, spec: _PathSpec, facts_excerpt: str) -> ConstitutionalAnalysisPath:
+        """Instantiate a reasoning path spec for one query's facts excerpt"""
         
-    def _generate_harm_test_conclusion(self, case_facts: str) -> str:
-        """Generate harm test constitutional conclusion"""
-        return "Conclusión basada en test de daño a terceros constitucional."
+        return ConstitutionalAnalysisPath(
+            starting_principle=spec.principle,
+            precedent_chain=self._precedent_chains[spec.precedent_keys],
+            constitutional_conclusion=spec.conclusion_prefix + facts_excerpt + spec.conclusion_suffix,
+            confidence_score=spec.confidence,
+            citation_verification_status=True,
+            alternative_interpretations=spec.alternatives
+        )
         
-    def _generate_morality_conclusion(self, case_facts: str) -> str:
-        """Generate constitutional morality conclusion"""
-        return "Conclusión basada en moralidad constitucional y neutralidad estatal."
+    def generate_comprehensive_constitutional_analysis(self, 
+                                                    case_facts: str,
+                                                    legal_question: str) -> str:
+        """
+        Generate comprehensive constitutional analysis addressing AI limitations
+        
+        Features:
+        1. Multiple reasoning paths (reduces prompt sensitivity)
+        2. Verified citations (eliminates hallucinations)  
+        3. Structured analysis (addresses context window issues)
+        4. Complete traceability (ensures transparency)
+        
+        Reports are cached per instance, so identical (facts, question) pairs
+        are only rendered once
+        """
+        
+        cache_key = hashlib.blake2b(
+            case_facts.encode() + b"\x00" + legal_question.encode(), digest_size=16
+        ).digest()
+        with self._report_cache_lock:
+            cached_analysis = self._report_cache.get(cache_key)
+            if cached_analysis is not None:
+                self._report_cache.move_to_end(cache_key)
+                return cached_analysis
+            
+        # Get multiple constitutional reasoning paths
+        reasoning_paths = self.find_constitutional_reasoning_paths(
+            constitutional_issue=legal_question,
+            case_facts=case_facts
+        )
+        
+        # Build comprehensive analysis integrating all paths
+        analysis = "".join((
+            _REPORT_HEADER,
+            legal_question,
+            _REPORT_FACTS_HEADING,
+            case_facts,
+            _REPORT_SECTIONS_I_TO_III,
+            self._format_multiple_reasoning_paths(reasoning_paths),
+            _REPORT_SECTIONS_IV_TO_V,
+            self._apply_integrated_constitutional_test(case_facts, legal_question),
+            _REPORT_SECTION_VI,
+            self._generate_integrated_constitutional_conclusion(reasoning_paths, case_facts),
+            _REPORT_SECTION_VII
+        ))
+        
+        if self.report_cache_size > 0:
+            # Rendering ran unlocked; concurrent misses on one key store equal reports
+            with self._report_cache_lock:
+                self._report_cache[cache_key] = analysis
+                while len(self._report_cache) > self.report_cache_size:
+                    self._report_cache.popitem(last=False)
+                
+        return analysis
+        
+    def _format_multiple_reasoning_paths(self, paths: Tuple[ConstitutionalAnalysisPath, ...]) -> str:
+        """Format multiple reasoning paths for comprehensive analysis"""
+        
+        formatted_paths = []
+        
+        for i, path in enumerate(paths, 1):
+            formatted_paths.append(_PATH_BLOCK_TEMPLATE.format_map({
+                "idx": i,
+                "title": _PRINCIPLE_TITLE[path.starting_principle],
+                "confidence": path.confidence_score,
+                "check": '✅' if path.citation_verification_status else '❌',
+                "conclusion": path.constitutional_conclusion,
+                "alts": "\n".join("- " + alt for alt in path.alternative_interpretations)
+            }))
+        
+        return "".join(formatted_paths)
         
     def _apply_integrated_constitutional_test(self, case_facts: str, legal_question: str) -> str:
         """Apply integrated constitutional test to case"""
@@ -508,11 +633,11 @@ class ConstitutionalKnowledgeGraph:
 """
         
     def _generate_integrated_constitutional_conclusion(self, 
-                                                    paths: List[ConstitutionalAnalysisPath],
+                                                    paths: Tuple[ConstitutionalAnalysisPath, ...],
                                                     case_facts: str) -> str:
         """Generate integrated constitutional conclusion from all paths"""
         
-        highest_confidence_path = max(paths, key=lambda p: p.confidence_score)
+        highest_confidence_path = max(paths, key=attrgetter("confidence_score"))
         
         return f"""
 ### Conclusión Constitucional Integrada
@@ -539,9 +664,11 @@ def main():
     Demonstration of enhanced constitutional analysis addressing AI limitations
     """
     
-    print("🏛️ JurisRank P7 Enhanced Constitutional Analysis Engine")
-    print("📚 Integration of Academic AI Limitations Research")
-    print("=" * 60)
+    write = sys.stdout.write
+    
+    write("🏛️ JurisRank P7 Enhanced Constitutional Analysis Engine\n"
+          "📚 Integration of Academic AI Limitations Research\n"
+          + "=" * 60 + "\n")
     
     # Initialize enhanced engine
     engine = ConstitutionalKnowledgeGraph()
@@ -565,14 +692,17 @@ def main():
         legal_question=legal_question
     )
     
-    print("📄 ANÁLISIS CONSTITUCIONAL GENERADO:")
-    print("=" * 60)
-    print(analysis)
+    # The report is written in one call rather than line-buffered prints
+    write("📄 ANÁLISIS CONSTITUCIONAL GENERADO:\n" + "=" * 60 + "\n")
+    write(analysis)
+    write("\n")
     
-    print("\n" + "=" * 60)
-    print("✅ Análisis completado con verificación de fuentes y trazabilidad completa")
-    print("🧠 AI Limitations mitigated: Context windows, hallucinations, prompt sensitivity")
-    print("🏛️ Constitutional analysis enhanced with academic research integration")
+    write("\n" + "=" * 60 + "\n"
+          "✅ Análisis completado con verificación de fuentes y trazabilidad completa\n"
+          "🧠 AI Limitations mitigated: Context windows, hallucinations, prompt sensitivity\n"
+          "🏛️ Constitutional analysis enhanced with academic research integration\n")
+    sys.stdout.flush()
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     main()
\ No newline at end of file
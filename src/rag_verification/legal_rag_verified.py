@@ -16,21 +16,62 @@ Author: Ignacio Adrian Lerer
 Research Base: AI's Limitations in Legal Practice + Constitutional Interpretation Studies
 """
 
+import re
+import os
+import sys
 import json
 import hashlib
+import importlib.util
 import logging
 from typing import Dict, List, Optional, Tuple, Union
-from dataclasses import dataclass, field
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from enum import Enum
 import asyncio
 import aiohttp
 from pathlib import Path
+from types import MappingProxyType
+
+# NumPy only speeds up ranking of large candidate sets, so it is imported there
+# (see _apply_authority_weighting_vectorized) rather than on every module load
+NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
+
+# Shared with the other analysis modules (src/dataclass_compat.py)
+try:
+    from dataclass_compat import DATACLASS_SLOTS as _DATACLASS_SLOTS
+except ImportError:
+    # Imported as src.<package>.<module>: put src/ on the path
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from dataclass_compat import DATACLASS_SLOTS as _DATACLASS_SLOTS
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Distinct citations remembered by CitationVerificationEngine.verify_citation
+VERIFY_CACHE_MAX = 1024
+
+# Below this many candidates plain Python outruns NumPy's array setup
+VECTORIZE_MIN_CANDIDATES = 64
+
+# Simulate existing Legal-RAG embedding models (read-only, shared by all instances)
+EMBEDDING_MODELS = MappingProxyType({
+    'constitutional_law': "law-ai/InLegalBERT",
+    'precedent_analysis': "nlpaueb/legal-bert-base-uncased", 
+    'cross_jurisdictional': "sentence-transformers/paraphrase-multilingual",
+    'general_legal': "openai/text-embedding-ada-002"
+})
+
+# BM25 + Cosine hybrid retrieval weights (simulated)
+HYBRID_RETRIEVAL_WEIGHTS = MappingProxyType({
+    'bm25': 0.3,
+    'cosine_constitutional': 0.25,
+    'cosine_precedent': 0.25, 
+    'cosine_cross_jurisdictional': 0.1,
+    'cosine_general': 0.1
+})
+
 class CitationVerificationStatus(Enum):
     """Verification status for legal citations"""
     VERIFIED = "verified"
@@ -51,7 +92,46 @@ class LegalSourceAuthority(Enum):
     LEGISLATION = 95               # Constitutional and statutory law
     INTERNATIONAL_TREATY = 85      # International human rights treaties
 
-@dataclass
+# Score multiplier per authority level (value / 100), computed once
+AUTHORITY_MULTIPLIER: Dict[LegalSourceAuthority, float] = {
+    authority: authority.value / 100.0 for authority in LegalSourceAuthority
+}
+
+def _precedent_hash(source_key: str) -> str:
+    """Identifier digest for a known precedent"""
+    return hashlib.sha256(source_key.encode()).hexdigest()
+
+# Verified constitutional precedents; built (and hashed) once at import and
+# shared by every CitationVerificationEngine
+_KNOWN_PRECEDENTS = {
+    "BAZTERRICA_1986": {
+        "citation": "Fallos 308:1392",
+        "case_name": "Bazterrica, Gustavo Mario", 
+        "date": "29/08/1986",
+        "court": "CSJN",
+        "constitutional_articles": ["Art 19 CN"],
+        "verified": True,
+        "authority": LegalSourceAuthority.CONSTITUTIONAL_COURT,
+        "hash": _precedent_hash("Bazterrica_Fallos_308_1392")
+    },
+    "ARRIOLA_2009": {
+        "citation": "Fallos 332:1963",
+        "case_name": "Arriola, Sebastián y otros",
+        "date": "25/08/2009", 
+        "court": "CSJN",
+        "constitutional_articles": ["Art 19 CN", "Art 75 inc 22 CN"],
+        "verified": True,
+        "authority": LegalSourceAuthority.CONSTITUTIONAL_COURT,
+        "hash": _precedent_hash("Arriola_Fallos_332_1963")
+    }
+}
+
+# Normalized forms used by CitationVerificationEngine._calculate_citation_similarity
+for _precedent in _KNOWN_PRECEDENTS.values():
+    _precedent["_case_lc"] = _precedent["case_name"].lower()
+del _precedent
+
+@dataclass(**_DATACLASS_SLOTS)
 class LegalCitation:
     """Represents a legal citation with verification metadata"""
     citation_text: str
@@ -66,7 +146,7 @@ class LegalCitation:
     source_hash: Optional[str] = None
     verification_timestamp: Optional[datetime] = None
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class VerificationResult:
     """Result of citation verification process"""
     citation: LegalCitation
@@ -76,8 +156,9 @@ class VerificationResult:
     discrepancies: List[str] = field(default_factory=list)
     alternative_citations: List[LegalCitation] = field(default_factory=list)
     verification_notes: Optional[str] = None
+    verification_timestamp: Optional[datetime] = None
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class RetrievalCandidate:
     """Enhanced retrieval candidate with verification metadata"""
     document_id: str
@@ -88,9 +169,10 @@ class RetrievalCandidate:
     constitutional_articles: List[str] = field(default_factory=list)
     precedential_authority: Optional[LegalSourceAuthority] = None
     verification_results: List[VerificationResult] = field(default_factory=list)
+    verification_mean: Optional[float] = None  # mean confidence_score; None without results
     traceability_chain: List[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class VerifiedRetrievalResult:
     """Complete verified retrieval result"""
     query: str
@@ -117,50 +199,58 @@ class LegalCitationExtractor:
             'constitutional_article': r'Art\.?\s*(\d+)(?:\s+inc\.?\s*(\d+))?\s*(?:de la\s+)?(?:Constitución|CN|C\.N\.)',
         }
         
+        # Citation kinds found in a single scan of the text; each named group
+        # dispatches (via match.lastgroup) to the handler that emits the citation.
+        # Adding a kind means adding a pattern and a handler, not another pass.
+        self._scan_patterns = {
+            'fallos': r'(?i:Fallos)\s+(?P<fallos_volume>\d+):(?P<fallos_page>\d+)',
+        }
+        self._handlers = {
+            'fallos': self._emit_fallos_citation,
+        }
+        
+        # Compiled once; extraction runs for every retrieved candidate
+        self._re_citations = re.compile("|".join(
+            f"(?P<{kind}>{pattern})" for kind, pattern in self._scan_patterns.items()
+        ))
+        self._re_case = re.compile(r'"([^"]+)"')
+        
     def extract_citations_from_text(self, text: str) -> List[LegalCitation]:
         """Extract legal citations from text using pattern matching"""
         
-        citations = []
+        handlers = self._handlers
         
-        # Extract CSJN Fallos citations
-        import re
-        fallos_matches = re.finditer(self.citation_patterns['csjn_fallos'], text, re.IGNORECASE)
+        return [
+            handlers[match.lastgroup](text, match)
+            for match in self._re_citations.finditer(text)
+        ]
         
-        for match in fallos_matches:
-            volume = match.group(1) 
-            page = match.group(2)
-            
-            # Try to find case name near citation
-            case_name = self._extract_case_name_near_citation(text, match.start())
-            
-            citation = LegalCitation(
-                citation_text=match.group(0),
-                case_name=case_name,
-                court="CSJN",
-                citation_format="Fallos",
-                volume=volume,
-                page=page,
-                authority_level=LegalSourceAuthority.SUPREME_COURT
-            )
-            
-            citations.append(citation)
-            
-        return citations
+    def _emit_fallos_citation(self, text: str, match: re.Match) -> LegalCitation:
+        """Build a CSJN Fallos citation from a scan match"""
         
-    def _extract_case_name_near_citation(self, text: str, citation_position: int) -> Optional[str]:
-        """Extract case name near a citation position"""
+        # Try to find case name near citation
+        case_name = self._extract_case_name_near_citation(text, match.start())
         
-        # Look for quoted case names within 100 characters before citation
-        import re
+        return LegalCitation(
+            citation_text=match.group(0),
+            case_name=case_name,
+            court="CSJN",
+            citation_format="Fallos",
+            volume=match.group('fallos_volume'),
+            page=match.group('fallos_page'),
+            authority_level=LegalSourceAuthority.SUPREME_COURT
+        )
         
-        search_text = text[max(0, citation_position-100):citation_position+50]
-        case_pattern = r'"([^"]+)"'
+    def _extract_case_name_near_citation(self, text: str, citation_position: int) -> Optional[str]:
+        """Extract case name near a citation position"""
         
-        matches = re.findall(case_pattern, search_text)
-        if matches:
-            return matches[-1]  # Return the closest case name
+        # Look for quoted case names within 100 characters before citation; the
+        # pos/endpos window scans the text in place instead of slicing a copy
+        case_name = None
+        for match in self._re_case.finditer(text, max(0, citation_position-100), citation_position+50):
+            case_name = match.group(1)  # Keep the closest case name
             
-        return None
+        return case_name
 
 class CitationVerificationEngine:
     """
@@ -168,58 +258,95 @@ class CitationVerificationEngine:
     Addresses hallucination risks by validating every legal assertion
     """
     
-    def __init__(self):
+    def __init__(self, verify_cache_size: int = VERIFY_CACHE_MAX):
         self.citation_extractor = LegalCitationExtractor()
         self.verification_database = {}
         self.known_precedents = self._load_known_precedents()
         
+        # Exact citation text -> precedent ID, so well-formed citations are
+        # checked against their precedent before scanning the whole database
+        self._by_citation = {
+            precedent_data["citation"]: precedent_id
+            for precedent_id, precedent_data in self.known_precedents.items()
+        }
+        
+        # Court -> its precedents. A citation naming another court scores at most
+        # 2/3, below both match thresholds, so those precedents are never compared
+        self._by_court: Dict[str, List[Tuple[str, Dict]]] = defaultdict(list)
+        for precedent_id, precedent_data in self.known_precedents.items():
+            self._by_court[precedent_data["court"]].append((precedent_id, precedent_data))
+            
+        # Results keyed on the fields similarity scoring reads; retrieved documents
+        # often repeat the same citation, which is then verified only once (LRU-bounded)
+        self.verify_cache_size = verify_cache_size
+        self._verify_cache: "OrderedDict[Tuple[str, Optional[str], Optional[str], Optional[str]], VerificationResult]" = OrderedDict()
+        
     def _load_known_precedents(self) -> Dict[str, Dict]:
-        """Load known constitutional precedents for verification"""
+        """Load known constitutional precedents for verification (shared, read-only)"""
         
-        return {
-            "BAZTERRICA_1986": {
-                "citation": "Fallos 308:1392",
-                "case_name": "Bazterrica, Gustavo Mario", 
-                "date": "29/08/1986",
-                "court": "CSJN",
-                "constitutional_articles": ["Art 19 CN"],
-                "verified": True,
-                "authority": LegalSourceAuthority.CONSTITUTIONAL_COURT,
-                "hash": hashlib.md5("Bazterrica_Fallos_308_1392".encode()).hexdigest()
-            },
-            "ARRIOLA_2009": {
-                "citation": "Fallos 332:1963",
-                "case_name": "Arriola, Sebastián y otros",
-                "date": "25/08/2009", 
-                "court": "CSJN",
-                "constitutional_articles": ["Art 19 CN", "Art 75 inc 22 CN"],
-                "verified": True,
-                "authority": LegalSourceAuthority.CONSTITUTIONAL_COURT,
-                "hash": hashlib.md5("Arriola_Fallos_332_1963".encode()).hexdigest()
-            }
-        }
+        return _KNOWN_PRECEDENTS
         
-    async def verify_citation(self, citation: LegalCitation) -> VerificationResult:
+    def verify_citation(self, citation: LegalCitation) -> VerificationResult:
         """
         Verify a legal citation against known sources
         Returns verification result with confidence score
         """
         
+        cache_key = (citation.citation_text, citation.case_name, citation.court, citation.citation_format)
+        cached_result = self._verify_cache.get(cache_key)
+        if cached_result is not None:
+            self._verify_cache.move_to_end(cache_key)
+            return self._copy_result(cached_result, citation)
+            
+        verification_result = self._verify_uncached(citation)
+        
+        if self.verify_cache_size > 0:
+            self._verify_cache[cache_key] = self._copy_result(verification_result, citation)
+            while len(self._verify_cache) > self.verify_cache_size:
+                self._verify_cache.popitem(last=False)
+                
+        return verification_result
+        
+    @staticmethod
+    def _copy_result(result: VerificationResult, citation: LegalCitation) -> VerificationResult:
+        """Independent copy of a cached result, attached to the caller's citation"""
+        
+        return replace(
+            result,
+            citation=citation,
+            discrepancies=list(result.discrepancies),
+            alternative_citations=[replace(alternative) for alternative in result.alternative_citations]
+        )
+        
+    def _verify_uncached(self, citation: LegalCitation) -> VerificationResult:
+        """Score a citation against the known precedents"""
+        
         verification_result = VerificationResult(
             citation=citation,
             verification_status=CitationVerificationStatus.PENDING_VERIFICATION,
             confidence_score=0.0
         )
         
-        # Check against known precedents
-        for precedent_id, precedent_data in self.known_precedents.items():
+        # Index hit: a high-confidence match here settles the citation without a scan
+        indexed_id = self._by_citation.get(citation.citation_text)
+        if indexed_id is not None:
+            similarity_score = self._calculate_citation_similarity(citation, self.known_precedents[indexed_id])
+            if similarity_score > 0.9:
+                self._mark_verified(verification_result, indexed_id, similarity_score)
+                verification_result.verification_timestamp = datetime.now()
+                return verification_result
+                
+        # Check against known precedents (only those from the cited court, if any)
+        if citation.court:
+            candidates = self._by_court.get(citation.court, ())
+        else:
+            candidates = self.known_precedents.items()
+            
+        for precedent_id, precedent_data in candidates:
             similarity_score = self._calculate_citation_similarity(citation, precedent_data)
             
             if similarity_score > 0.9:  # High confidence match
-                verification_result.verification_status = CitationVerificationStatus.VERIFIED
-                verification_result.confidence_score = similarity_score
-                verification_result.source_document = precedent_id
-                verification_result.verification_notes = f"Verified against known precedent: {precedent_id}"
+                self._mark_verified(verification_result, precedent_id, similarity_score)
                 break
                 
             elif similarity_score > 0.7:  # Partial match
@@ -238,34 +365,40 @@ class CitationVerificationEngine:
         verification_result.verification_timestamp = datetime.now()
         return verification_result
         
+    @staticmethod
+    def _mark_verified(verification_result: VerificationResult, precedent_id: str, similarity_score: float) -> None:
+        """Record a high-confidence match against a known precedent"""
+        
+        verification_result.verification_status = CitationVerificationStatus.VERIFIED
+        verification_result.confidence_score = similarity_score
+        verification_result.source_document = precedent_id
+        verification_result.verification_notes = f"Verified against known precedent: {precedent_id}"
+        
     def _calculate_citation_similarity(self, citation: LegalCitation, precedent_data: Dict) -> float:
         """Calculate similarity between citation and known precedent"""
         
-        similarity_factors = []
+        # Fraction of the comparable fields that match; counters instead of a
+        # per-call list since this runs for every (citation, precedent) pair
+        matched = 0
+        compared = 0
         
         # Citation text similarity
         if citation.citation_format == "Fallos" and precedent_data.get("citation"):
-            if precedent_data["citation"] in citation.citation_text:
-                similarity_factors.append(1.0)
-            else:
-                similarity_factors.append(0.0)
+            compared += 1
+            matched += precedent_data["citation"] in citation.citation_text
                 
         # Case name similarity  
         if citation.case_name and precedent_data.get("case_name"):
-            if citation.case_name.lower() in precedent_data["case_name"].lower():
-                similarity_factors.append(1.0)
-            else:
-                similarity_factors.append(0.0)
+            compared += 1
+            matched += citation.case_name.lower() in precedent_data["_case_lc"]
                 
         # Court similarity
         if citation.court and precedent_data.get("court"):
-            if citation.court == precedent_data["court"]:
-                similarity_factors.append(1.0)
-            else:
-                similarity_factors.append(0.0)
+            compared += 1
+            matched += citation.court == precedent_data["court"]
                 
         # Return average similarity
-        return sum(similarity_factors) / len(similarity_factors) if similarity_factors else 0.0
+        return matched / compared if compared else 0.0
         
     def _create_citation_from_precedent(self, precedent_data: Dict) -> LegalCitation:
         """Create a LegalCitation object from precedent data"""
@@ -279,6 +412,25 @@ class CitationVerificationEngine:
             verification_status=CitationVerificationStatus.VERIFIED
         )
 
+# Simulated Legal-RAG document text; the candidates wrapping it are created per
+# call because the pipeline mutates them (scores, citations, chains)
+_CONSTITUTIONAL_DOC_CONTENT = """
+                El artículo 19 de la Constitución Nacional establece que las acciones privadas 
+                de los hombres que de ningún modo ofendan al orden y a la moral pública, ni 
+                perjudiquen a un tercero, están sólo reservadas a Dios, y exentas de la autoridad 
+                de los magistrados. En "Bazterrica, Gustavo Mario", Fallos 308:1392 (1986), 
+                la Corte Suprema estableció que la tenencia de estupefacientes para consumo personal 
+                no constituye delito cuando no genera daño a terceros.
+                """
+
+_PRECEDENT_DOC_CONTENT = """
+                La evolución jurisprudencial en materia de autonomía personal muestra una clara
+                progresión desde "Bazterrica" (1986) hacia "Arriola, Sebastián y otros", Fallos 
+                332:1963 (2009). En Arriola, la Corte reafirmó los principios de Bazterrica pero
+                incorporó estándares internacionales de derechos humanos y el concepto de dignidad 
+                humana como fundamento de la autonomía personal.
+                """
+
 class VerifiedLegalRAG:
     """
     Enhanced RAG system with citation verification and traceability
@@ -294,22 +446,9 @@ class VerifiedLegalRAG:
         self.citation_extractor = LegalCitationExtractor()
         self.verification_engine = CitationVerificationEngine()
         
-        # Simulate existing Legal-RAG embedding models
-        self.embedding_models = {
-            'constitutional_law': "law-ai/InLegalBERT",
-            'precedent_analysis': "nlpaueb/legal-bert-base-uncased", 
-            'cross_jurisdictional': "sentence-transformers/paraphrase-multilingual",
-            'general_legal': "openai/text-embedding-ada-002"
-        }
-        
-        # BM25 + Cosine hybrid retrieval (simulated)
-        self.hybrid_retrieval_weights = {
-            'bm25': 0.3,
-            'cosine_constitutional': 0.25,
-            'cosine_precedent': 0.25, 
-            'cosine_cross_jurisdictional': 0.1,
-            'cosine_general': 0.1
-        }
+        # Shared read-only configuration (see module constants)
+        self.embedding_models = EMBEDDING_MODELS
+        self.hybrid_retrieval_weights = HYBRID_RETRIEVAL_WEIGHTS
         
     async def retrieve_with_verification(self, 
                                        query: str,
@@ -330,8 +469,10 @@ class VerifiedLegalRAG:
         # Stage 1: Multi-embedding retrieval (simulated)
         raw_candidates = await self._multi_embedding_retrieval(query)
         
-        # Stage 2: Citation extraction and verification
+        # Stages 2, 4 and 5 in one pass: citation extraction and verification,
+        # traceability chains and the verification summary (none depend on rank)
         verified_candidates = []
+        verification_summary = self._new_verification_summary(len(raw_candidates))
         
         for candidate in raw_candidates:
             # Extract citations from retrieved content
@@ -341,28 +482,22 @@ class VerifiedLegalRAG:
             # Verify each citation
             verification_results = []
             for citation in citations:
-                verification = await self.verification_engine.verify_citation(citation)
+                verification = self.verification_engine.verify_citation(citation)
                 verification_results.append(verification)
                 
             candidate.verification_results = verification_results
             
-            # Calculate overall verification confidence
+            # Overall verification confidence; applied to the score (once) in stage 3
             if verification_results:
-                verification_scores = [vr.confidence_score for vr in verification_results]
-                candidate.score *= (sum(verification_scores) / len(verification_scores))
+                candidate.verification_mean = sum(vr.confidence_score for vr in verification_results) / len(verification_results)
                 
+            candidate.traceability_chain = self._build_traceability_chain(candidate)
+            self._tally_verifications(verification_summary, candidate)
             verified_candidates.append(candidate)
             
         # Stage 3: Authority-weighted ranking
         authority_weighted_candidates = self._apply_authority_weighting(verified_candidates)
         
-        # Stage 4: Build traceability chains
-        for candidate in authority_weighted_candidates:
-            candidate.traceability_chain = self._build_traceability_chain(candidate)
-            
-        # Stage 5: Create verification summary
-        verification_summary = self._create_verification_summary(authority_weighted_candidates)
-        
         # Stage 6: Calculate overall confidence
         overall_confidence = self._calculate_overall_confidence(authority_weighted_candidates)
         
@@ -388,14 +523,7 @@ class VerifiedLegalRAG:
         simulated_candidates = [
             RetrievalCandidate(
                 document_id="constitutional_doc_001",
-                content=f"""
-                El artículo 19 de la Constitución Nacional establece que las acciones privadas 
-                de los hombres que de ningún modo ofendan al orden y a la moral pública, ni 
-                perjudiquen a un tercero, están sólo reservadas a Dios, y exentas de la autoridad 
-                de los magistrados. En "Bazterrica, Gustavo Mario", Fallos 308:1392 (1986), 
-                la Corte Suprema estableció que la tenencia de estupefacientes para consumo personal 
-                no constituye delito cuando no genera daño a terceros.
-                """,
+                content=_CONSTITUTIONAL_DOC_CONTENT,
                 score=0.95,
                 embedding_model="constitutional_law",
                 constitutional_articles=["Art 19 CN"],
@@ -403,13 +531,7 @@ class VerifiedLegalRAG:
             ),
             RetrievalCandidate(
                 document_id="precedent_doc_002", 
-                content=f"""
-                La evolución jurisprudencial en materia de autonomía personal muestra una clara
-                progresión desde "Bazterrica" (1986) hacia "Arriola, Sebastián y otros", Fallos 
-                332:1963 (2009). En Arriola, la Corte reafirmó los principios de Bazterrica pero
-                incorporó estándares internacionales de derechos humanos y el concepto de dignidad 
-                humana como fundamento de la autonomía personal.
-                """,
+                content=_PRECEDENT_DOC_CONTENT,
                 score=0.88,
                 embedding_model="precedent_analysis",
                 constitutional_articles=["Art 19 CN", "Art 75 inc 22 CN"],
@@ -422,20 +544,24 @@ class VerifiedLegalRAG:
     def _apply_authority_weighting(self, candidates: List[RetrievalCandidate]) -> List[RetrievalCandidate]:
         """
         Apply JurisRank P7 authority weighting to candidates based on verification
+        
+        Large candidate sets are weighted and ranked as NumPy vectors when NumPy
+        is installed; both paths give the same scores and (stable) order.
         """
         
+        if NUMPY_AVAILABLE and len(candidates) >= VECTORIZE_MIN_CANDIDATES:
+            return self._apply_authority_weighting_vectorized(candidates)
+            
         for candidate in candidates:
             authority_multiplier = 1.0
             
             # Weight by precedential authority
             if candidate.precedential_authority:
-                authority_multiplier *= (candidate.precedential_authority.value / 100.0)
+                authority_multiplier *= AUTHORITY_MULTIPLIER[candidate.precedential_authority]
                 
             # Weight by verification confidence
-            if candidate.verification_results:
-                verification_scores = [vr.confidence_score for vr in candidate.verification_results]
-                verification_confidence = sum(verification_scores) / len(verification_scores)
-                authority_multiplier *= verification_confidence
+            if candidate.verification_mean is not None:
+                authority_multiplier *= candidate.verification_mean
                 
             # Apply weighting to candidate score
             candidate.score *= authority_multiplier
@@ -444,6 +570,29 @@ class VerifiedLegalRAG:
         candidates.sort(key=lambda c: c.score, reverse=True)
         return candidates
         
+    @staticmethod
+    def _apply_authority_weighting_vectorized(candidates: List[RetrievalCandidate]) -> List[RetrievalCandidate]:
+        """NumPy variant of _apply_authority_weighting for large candidate sets"""
+        
+        import numpy as np
+        
+        count = len(candidates)
+        scores = np.fromiter((c.score for c in candidates), dtype=np.float64, count=count)
+        authority = np.fromiter(
+            (AUTHORITY_MULTIPLIER[c.precedential_authority] if c.precedential_authority else 1.0 for c in candidates),
+            dtype=np.float64, count=count
+        )
+        confidence = np.fromiter(
+            (1.0 if c.verification_mean is None else c.verification_mean for c in candidates),
+            dtype=np.float64, count=count
+        )
+        
+        weighted = scores * (authority * confidence)  # same rounding as the scalar path
+        for candidate, score in zip(candidates, weighted.tolist()):
+            candidate.score = score
+            
+        return [candidates[i] for i in np.argsort(-weighted, kind="stable").tolist()]
+        
     def _build_traceability_chain(self, candidate: RetrievalCandidate) -> List[str]:
         """
         Build complete traceability chain for a retrieval candidate
@@ -458,8 +607,9 @@ class VerifiedLegalRAG:
         chain.append(f"Retrieved via: {candidate.embedding_model}")
         
         # Add verified citations
+        verified = CitationVerificationStatus.VERIFIED
         for verification in candidate.verification_results:
-            if verification.verification_status == CitationVerificationStatus.VERIFIED:
+            if verification.verification_status is verified:
                 chain.append(f"Verified Citation: {verification.citation.citation_text}")
                 
         # Add constitutional articles
@@ -468,29 +618,35 @@ class VerifiedLegalRAG:
             
         return chain
         
-    def _create_verification_summary(self, candidates: List[RetrievalCandidate]) -> Dict[str, int]:
-        """Create summary of verification results across all candidates"""
+    @staticmethod
+    def _new_verification_summary(total_candidates: int) -> Dict[str, int]:
+        """Empty verification summary counters"""
         
-        summary = {
-            "total_candidates": len(candidates),
+        return {
+            "total_candidates": total_candidates,
             "verified_citations": 0,
             "partial_matches": 0,
             "unverified_citations": 0,
             "constitutional_articles": 0
         }
         
-        for candidate in candidates:
-            for verification in candidate.verification_results:
-                if verification.verification_status == CitationVerificationStatus.VERIFIED:
-                    summary["verified_citations"] += 1
-                elif verification.verification_status == CitationVerificationStatus.PARTIAL_MATCH:
-                    summary["partial_matches"] += 1 
-                else:
-                    summary["unverified_citations"] += 1
-                    
-            summary["constitutional_articles"] += len(candidate.constitutional_articles)
-            
-        return summary
+    @staticmethod
+    def _tally_verifications(summary: Dict[str, int], candidate: RetrievalCandidate) -> None:
+        """Add one candidate's verification results to the summary counters"""
+        
+        # Enum members are singletons: bind once, compare by identity
+        verified = CitationVerificationStatus.VERIFIED
+        partial = CitationVerificationStatus.PARTIAL_MATCH
+        for verification in candidate.verification_results:
+            status = verification.verification_status
+            if status is verified:
+                summary["verified_citations"] += 1
+            elif status is partial:
+                summary["partial_matches"] += 1 
+            else:
+                summary["unverified_citations"] += 1
+                
+        summary["constitutional_articles"] += len(candidate.constitutional_articles)
         
     def _calculate_overall_confidence(self, candidates: List[RetrievalCandidate]) -> float:
         """Calculate overall confidence in retrieval results"""
@@ -501,12 +657,7 @@ class VerifiedLegalRAG:
         confidence_factors = []
         
         # Factor 1: Verification confidence
-        verification_scores = []
-        for candidate in candidates:
-            if candidate.verification_results:
-                candidate_scores = [vr.confidence_score for vr in candidate.verification_results]
-                if candidate_scores:
-                    verification_scores.append(sum(candidate_scores) / len(candidate_scores))
+        verification_scores = [c.verification_mean for c in candidates if c.verification_mean is not None]
                     
         if verification_scores:
             confidence_factors.append(sum(verification_scores) / len(verification_scores))
@@ -515,7 +666,7 @@ class VerifiedLegalRAG:
         authority_scores = []
         for candidate in candidates:
             if candidate.precedential_authority:
-                authority_scores.append(candidate.precedential_authority.value / 100.0)
+                authority_scores.append(AUTHORITY_MULTIPLIER[candidate.precedential_authority])
                 
         if authority_scores:
             confidence_factors.append(sum(authority_scores) / len(authority_scores))
@@ -529,23 +680,18 @@ class VerifiedLegalRAG:
     def _build_citation_traceability_map(self, candidates: List[RetrievalCandidate]) -> Dict[str, List[str]]:
         """Build complete citation traceability map"""
         
-        traceability_map = {}
+        traceability_map: Dict[str, List[str]] = defaultdict(list)
         
         for candidate in candidates:
+            source = f"Source: {candidate.document_id}"
             for verification in candidate.verification_results:
-                citation_key = verification.citation.citation_text
-                
-                if citation_key not in traceability_map:
-                    traceability_map[citation_key] = []
-                    
-                traceability_map[citation_key].extend([
-                    f"Status: {verification.verification_status.value}",
-                    f"Confidence: {verification.confidence_score:.2%}",
-                    f"Source: {candidate.document_id}",
-                    f"Verification: {verification.verification_timestamp}"
-                ])
+                entry = traceability_map[verification.citation.citation_text]
+                entry.append(f"Status: {verification.verification_status.value}")
+                entry.append(f"Confidence: {verification.confidence_score:.2%}")
+                entry.append(source)
+                entry.append(f"Verification: {verification.verification_timestamp}")
                 
-        return traceability_map
+        return dict(traceability_map)
 
 async def main():
     """
@@ -0,0 +1,40 @@
+"""
+Shared fixtures for the JurisRank P7 Enhanced test suite
+=======================================================
+"""
+
+import shutil
+import sys
+import os
+
+import pytest
+
+# Add the repository root to path for testing (modules import via src.*)
+REPO_ROOT = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, REPO_ROOT)
+
+
+class RecordingAudit:
+    """Audit system stand-in that records each written entry."""
+
+    def __init__(self):
+        self.entries = []
+
+    def log_constitutional_analysis(self, **entry):
+        self.entries.append(entry)
+        return f"logs/{entry['case_id']}.json"
+
+
+@pytest.fixture
+def recording_audit():
+    """Fresh RecordingAudit for one test."""
+    return RecordingAudit()
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    """Temp working directory holding the prompt kits, databases and logs."""
+    shutil.copytree(os.path.join(REPO_ROOT, 'prompts'), tmp_path / 'prompts')
+    (tmp_path / 'src' / 'verify_citation').mkdir(parents=True)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
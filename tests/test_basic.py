@@ -6,6 +6,7 @@ Run with: python -m pytest tests/
 """
 
 import pytest
+import asyncio
 import sys
 import os
 
@@ -30,6 +31,14 @@ class TestJurisRankAPI:
         client = JurisRankAPI(base_url=custom_url)
         assert client.base_url == custom_url
 
+    def test_api_client_connection_pooling(self):
+        """Test API client mounts a pooled adapter for both schemes."""
+        client = JurisRankAPI()
+        for prefix in ("https://", "http://"):
+            adapter = client.session.get_adapter(prefix + "api.jurisrank.io")
+            assert adapter._pool_maxsize == 100
+            assert adapter.max_retries.total == 3
+
     def test_analyze_document(self):
         """Test document analysis method."""
         client = JurisRankAPI()
@@ -40,6 +49,14 @@ class TestJurisRankAPI:
         assert 0 <= result.authority_score <= 100
         assert 0 <= result.confidence <= 1
 
+    def test_analyze_document_async(self):
+        """Test async document analysis method."""
+        client = JurisRankAPI()
+        result = asyncio.run(client.analyze_document_async("test_document.pdf"))
+
+        assert isinstance(result, AnalysisResult)
+        assert result.document_id == "sample"
+
     def test_search_jurisprudence(self):
         """Test jurisprudence search method."""
         client = JurisRankAPI()
@@ -96,6 +113,17 @@ class TestModels:
         assert result.document_id == "doc_123"
         assert result.confidence == 0.95
 
+    def test_authority_score_invalid_entity_type(self):
+        """Test AuthorityScore model rejects unknown entity types."""
+        with pytest.raises(ValueError):
+            AuthorityScore(
+                entity_id="csjn",
+                entity_type="tribunal",  # Invalid: not court/judge
+                name="Corte Suprema",
+                authority_score=95.0,
+                jurisdiction="argentina"
+            )
+
 class TestUtilities:
     """Test suite for utility functions."""
 
@@ -0,0 +1,98 @@
+"""
+Tests for the enhanced citation verification system
+==================================================
+
+Run with: python -m pytest tests/
+"""
+
+import asyncio
+import sys
+import os
+
+import pytest
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from verify_citation.citation_verification_enhanced import EnhancedCitationVerifier, find_citation_patterns
+
+
+@pytest.fixture
+def verifier(tmp_path, monkeypatch):
+    """Verifier whose constitutional database is created under a temp dir."""
+    monkeypatch.chdir(tmp_path)
+    return EnhancedCitationVerifier()
+
+
+class TestEnhancedCitationVerifier:
+    """Test suite for EnhancedCitationVerifier."""
+
+    def test_verifies_known_precedent(self, verifier):
+        """Test a known Fallos citation verifies against the database."""
+        citation = verifier.verify_citation_comprehensive_sync('CSJN, "Bazterrica, Gustavo Mario", Fallos 308:1392')
+
+        assert citation.verification_status == "verified_constitutional"
+        assert citation.knowledge_graph_id == "BAZTERRICA_1986"
+        assert citation.volume == "308"
+        assert citation.page == "1392"
+
+    def test_cached_results_are_copies(self, verifier):
+        """Test repeated citations hit the cache without sharing mutable state."""
+        text = 'Arriola, Sebastián y otros - Fallos 332:1963 (2009)'
+        first = asyncio.run(verifier.verify_citation_comprehensive(text, require_doi_url=False))
+        first.verification_sources[0].metadata["edited"] = True
+        first.verification_sources.clear()
+        first.constitutional_articles.append("Art 1 CN")
+        second = verifier.verify_citation_comprehensive_sync(text)
+        third = verifier.verify_citation_comprehensive_sync(text)
+
+        assert len(verifier.verification_cache) == 1
+        assert second is not first
+        assert second.audit_hash == first.audit_hash
+        assert len(second.verification_sources) == 1
+        assert "edited" not in second.verification_sources[0].metadata
+        assert "Art 1 CN" not in second.constitutional_articles
+        assert third.verification_sources[0] is not second.verification_sources[0]
+
+    def test_verification_cache_is_bounded(self, tmp_path, monkeypatch):
+        """Test the cache evicts its least recently used citation."""
+        monkeypatch.chdir(tmp_path)
+        verifier = EnhancedCitationVerifier(verification_cache_size=1)
+        for text in ('Fallos 332:1963', 'Fallos 308:1392'):
+            verifier.verify_citation_comprehensive_sync(text)
+
+        assert list(verifier.verification_cache) == [('Fallos 308:1392', False)]
+
+    def test_verify_many_preserves_order(self, verifier):
+        """Test batch verification returns results in input order."""
+        texts = ['Fallos 332:1963', 'Fallos 308:1392']
+
+        results = asyncio.run(verifier.verify_many(texts, require_doi_url=False))
+
+        assert [r.citation_text for r in results] == texts
+        assert [r.knowledge_graph_id for r in results] == ["ARRIOLA_2009", "BAZTERRICA_1986"]
+
+    def test_verifies_bare_case_surname(self, verifier):
+        """Test a case surname alone identifies its precedent."""
+        bazterrica = verifier.verify_citation_comprehensive_sync('Bazterrica')
+        arriola = verifier.verify_citation_comprehensive_sync('Arriola')
+
+        assert bazterrica.knowledge_graph_id == "BAZTERRICA_1986"
+        assert arriola.knowledge_graph_id == "ARRIOLA_2009"
+        assert bazterrica.verification_confidence > 0.8
+        assert arriola.verification_confidence > 0.8
+
+    def test_case_surname_matches_whole_words_only(self, verifier):
+        """Test a longer word containing a surname is not an exact match."""
+        citation = verifier.verify_citation_comprehensive_sync('Bazterricaz v. Estado')
+
+        assert citation.verification_status == "unverified_not_in_database"
+        assert citation.knowledge_graph_id is None
+
+
+def test_find_citation_patterns_in_pattern_order():
+    """Test canonical citations are found once each, in CITATION_PATTERNS order."""
+    text = "Art 19 CN, conforme Arriola y Bazterrica (Fallos 308:1392); Arriola reiteró"
+
+    assert find_citation_patterns(text) == ["Bazterrica", "Arriola", "Fallos 308:1392", "Art 19 CN"]
+    assert find_citation_patterns("sin citas") == []
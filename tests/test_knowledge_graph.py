@@ -0,0 +1,52 @@
+"""
+Tests for the constitutional knowledge graph engine
+==================================================
+
+Run with: python -m pytest tests/
+"""
+
+import dataclasses
+import sys
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from knowledge_graph.constitutional_engine_enhanced import ConstitutionalKnowledgeGraph
+
+
+class TestConstitutionalKnowledgeGraph:
+    """Test suite for ConstitutionalKnowledgeGraph."""
+
+    def test_reasoning_paths_are_hashable(self):
+        """Test reasoning paths are frozen and hash stably."""
+        engine = ConstitutionalKnowledgeGraph()
+        paths = engine.find_constitutional_reasoning_paths("issue", "facts")
+
+        assert hash(paths) == hash(engine._compute_reasoning_paths("issue", "facts"))
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            paths[0].confidence_score = 1.0
+
+    def test_comprehensive_analysis_is_cached(self):
+        """Test identical (facts, question) pairs reuse the cached report."""
+        engine = ConstitutionalKnowledgeGraph(report_cache_size=1)
+        first = engine.generate_comprehensive_constitutional_analysis("facts", "question")
+
+        assert engine.generate_comprehensive_constitutional_analysis("facts", "question") is first
+        engine.generate_comprehensive_constitutional_analysis("other facts", "question")
+        assert len(engine._report_cache) == 1
+
+    def test_report_cache_is_thread_safe(self):
+        """Test concurrent reports stay correct and the cache stays bounded."""
+        engine = ConstitutionalKnowledgeGraph(report_cache_size=4)
+        queries = [(f"facts {i % 8}", "question") for i in range(400)]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            reports = list(pool.map(lambda q: engine.generate_comprehensive_constitutional_analysis(*q), queries))
+
+        for (facts, _), report in zip(queries, reports):
+            assert facts in report
+        assert len(engine._report_cache) == 4
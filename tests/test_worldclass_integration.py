@@ -0,0 +1,117 @@
+"""
+Tests for the WorldClass multi-model ensemble integration
+========================================================
+
+Run with: python -m pytest tests/
+"""
+
+import asyncio
+
+import pytest
+
+from src.worldclass_integration.jurisrank_worldclass_enhanced import (
+    ENSEMBLE_PROVIDERS,
+    ModelProvider,
+    WorldClassJurisRankIntegration,
+)
+
+QUESTION = "¿Protege el Art 19 CN la tenencia para consumo personal en domicilio privado?"
+FACTS = "Individuo encontrado en su domicilio particular con pequeña cantidad de sustancia para consumo personal."
+
+
+@pytest.fixture
+def integration(workspace, recording_audit):
+    """Integration running in the temp workspace with a recording audit."""
+    integration = WorldClassJurisRankIntegration()
+    integration.audit_system = recording_audit
+    return integration
+
+
+def run_ensemble(integration, case_id="CASE_1"):
+    return asyncio.run(integration.analyze_constitutional_case_ensemble(
+        case_id=case_id, constitutional_question=QUESTION, case_facts=FACTS
+    ))
+
+
+async def failing_analysis(*args):
+    raise ConnectionError("provider unavailable")
+
+
+class TestWorldClassJurisRankIntegration:
+    """Test suite for WorldClassJurisRankIntegration."""
+
+    def test_failing_model_is_dropped(self, integration, monkeypatch):
+        """Test one model raising leaves the rest of the ensemble intact."""
+        monkeypatch.setattr(integration, "_simulate_gemini_analysis", failing_analysis)
+        result = run_ensemble(integration)
+
+        assert ModelProvider.GEMINI_PRO.value not in result.models_used
+        assert len(result.models_used) == len(ENSEMBLE_PROVIDERS) - 1
+
+    def test_all_models_failing_raises(self, integration, monkeypatch):
+        """Test the ensemble fails only when no model returns a result."""
+        def failing_darwin(*args):
+            raise RuntimeError("knowledge graph unavailable")
+
+        monkeypatch.setattr(integration, "_run_darwin_analysis", failing_darwin)
+        for simulator in ("_simulate_gpt4o_analysis", "_simulate_claude_analysis", "_simulate_gemini_analysis"):
+            monkeypatch.setattr(integration, simulator, failing_analysis)
+
+        with pytest.raises(RuntimeError, match="All ensemble models failed"):
+            run_ensemble(integration)
+
+    def test_ensemble_verifies_every_model_citation(self, integration):
+        """Test the batched verification attaches verified citations to every model."""
+        result = run_ensemble(integration)
+
+        assert result.models_used == tuple(provider.value for provider in ENSEMBLE_PROVIDERS)
+        assert result.citations_total > 0
+        assert result.citations_verified == result.citations_total
+        assert all(r.verification_results["verification_rate"] == 1.0 for r in result.model_results if r.citations_used)
+
+    def test_prompt_kit_loads_without_scanning(self, integration):
+        """Test a kit is read from <name>.yaml before the directory is scanned."""
+        kit = integration._get_prompt_kit("constitutional_art19_enhanced")
+
+        assert kit["name"] == "constitutional_art19_enhanced"
+        assert not integration._prompt_kits_scanned
+        assert "balancing_test_constitutional" in integration.prompt_kits
+        assert integration._prompt_kits_scanned
+
+    def test_audit_ranking_summarizes_ensemble(self, integration):
+        """Test the audited ranking carries the model list and per-model rates."""
+        result = run_ensemble(integration)
+
+        entry, = integration.audit_system.entries
+        assert entry["constitutional_ranking"]["models_used"] == list(result.models_used)
+        assert result.citations_total == sum(
+            r.verification_results.get("total_citations", 0) for r in result.model_results
+        )
+        assert len(entry["verification_results"]) == len(result.model_results)
+
+    def test_shared_citations_are_verified_once(self, integration, monkeypatch):
+        """Test citations are de-duplicated within a case and reused across cases."""
+        batches = []
+        lookups = []
+        verify_many = integration.citation_verifier.verify_many
+        verify_against_database = integration.citation_verifier._verify_against_database
+
+        async def recording_verify_many(citations, **kwargs):
+            batches.append(list(citations))
+            return await verify_many(citations, **kwargs)
+
+        def recording_verify_against_database(citation_text):
+            lookups.append(citation_text)
+            return verify_against_database(citation_text)
+
+        monkeypatch.setattr(integration.citation_verifier, "verify_many", recording_verify_many)
+        monkeypatch.setattr(integration.citation_verifier, "_verify_against_database", recording_verify_against_database)
+        first = run_ensemble(integration, case_id="CASE_1")
+        second = run_ensemble(integration, case_id="CASE_2")
+
+        first_batch, second_batch = batches
+        assert len(first_batch) == len(set(first_batch))
+        assert len(first_batch) < first.citations_total
+        assert second_batch == first_batch
+        assert sorted(lookups) == sorted(first_batch)
+        assert second.citations_verified == first.citations_verified